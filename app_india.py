@@ -1,5 +1,8 @@
+import os
 import streamlit as st
 import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -10,13 +13,280 @@ st.set_page_config(
     layout="wide"
 )
 
-# Load data
+# Parquet generated by convert_to_parquet.py
+DATA_PATH = 'data/processed/india_jobs_cleaned.parquet'
+
+# Non-skill columns referenced by the dashboard (everything else is pruned at load time)
+BASE_COLS = [
+    'company', 'job_category', 'seniority',
+    'min_experience_clean', 'avg_salary_lpa'
+]
+
+# Load data; the skill_* columns are discovered from the file schema once here.
+# Persisted to disk so restarts skip parsing. Disk caches ignore ttl, so the file's
+# mtime is passed in to invalidate the entry when the data is regenerated.
+@st.cache_data(persist='disk', show_spinner=False)
+def load_data(data_mtime):
+    skill_cols = [col for col in pq.read_schema(DATA_PATH).names if col.startswith('skill_')]
+    df = pd.read_parquet(
+        DATA_PATH,
+        columns=BASE_COLS + skill_cols,
+        engine='pyarrow'
+    )
+    # Compact dtypes: categoricals for grouped/filtered text, uint8 for skill flags and years
+    for col in ['job_category', 'seniority', 'company']:
+        df[col] = df[col].astype('category')
+    df[skill_cols] = df[skill_cols].astype('uint8')
+    df['min_experience_clean'] = df['min_experience_clean'].astype('uint8')
+    return df, skill_cols, list(BASE_COLS)
+
+# Combined filter kernel, compiled once per process with Numba when it is installed.
+# Returns None otherwise and the caller falls back to the NumPy expression.
+@st.cache_resource
+def get_mask_kernel():
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def apply_mask(cat_codes, sal, exp, sel_codes, sal_lo, sal_hi, e_lo, e_hi, out):
+        for i in range(cat_codes.shape[0]):
+            c = cat_codes[i]
+            hit = False
+            for s in sel_codes:
+                if s == c:
+                    hit = True
+                    break
+            out[i] = hit and sal_lo <= sal[i] <= sal_hi and e_lo <= exp[i] <= e_hi
+
+    return apply_mask
+
+# Counts of a categorical column, most frequent first. Ties rank by first appearance
+# in the given rows (as value_counts does for plain strings) and unused categories
+# are left out.
+def seen_order_counts(col):
+    counts = col.value_counts(sort=False)
+    return counts.reindex(col.unique().dropna()).sort_values(ascending=False, kind='stable')
+
+# Chart aggregates
+def compute_aggregates(data):
+    lvl_stats = data.groupby('seniority', observed=True)['avg_salary_lpa'].agg(['median', 'size'])
+    # Sort the small grouped Series and build the plot frame directly
+    sen_median = lvl_stats['median'].sort_values()
+    salary_by_seniority = pd.DataFrame({
+        'seniority': sen_median.index,
+        'avg_salary_lpa': sen_median.values
+    })
+
+    cat_counts = seen_order_counts(data['job_category'])
+
+    # Drop categories with fewer than 5 jobs before aggregating rather than after
+    keep = cat_counts.index[cat_counts >= 5]
+    sub = data[data['job_category'].isin(keep)]
+    cat_salary = (
+        sub.groupby('job_category', observed=True)['avg_salary_lpa'].median()
+        .nlargest(10).rename_axis('job_category').reset_index()
+    )
+
+    # One NumPy reduction over the (rows x skills) uint8 matrix
+    counts = data[SKILL_COLS].to_numpy(dtype=np.uint8, copy=False).sum(axis=0)
+    nz = counts > 0
+    skill_names = [
+        SKILL_COLS[i].removeprefix('skill_').replace('_', ' ').title()
+        for i in np.flatnonzero(nz)
+    ]
+    skill_totals = counts[nz]
+
+    job_cats = cat_counts.head(8).rename_axis('Category').reset_index(name='Count')
+
+    seniority_dist = seen_order_counts(data['seniority']).rename_axis('Level').reset_index(name='Count')
+
+    top_companies = seen_order_counts(data['company']).head(15).rename_axis('Company').reset_index(name='Jobs')
+
+    # Experience is a small non-negative integer, so bincount replaces hashing
+    exp_counts = np.bincount(data['min_experience_clean'].to_numpy())
+    exp_idx = np.flatnonzero(exp_counts)[:15]
+    exp_dist = pd.DataFrame({'Experience (years)': exp_idx, 'Jobs': exp_counts[exp_idx]})
+
+    exp_salary = data.groupby('min_experience_clean')['avg_salary_lpa'].median().reset_index()
+    exp_salary = exp_salary[exp_salary['min_experience_clean'] <= 15]
+
+    return {
+        'lvl_stats': lvl_stats,
+        'salary_by_seniority': salary_by_seniority,
+        'cat_salary': cat_salary,
+        'skill_names': skill_names,
+        'skill_totals': skill_totals,
+        'cat_counts': cat_counts,
+        'job_cats': job_cats,
+        'seniority_dist': seniority_dist,
+        'top_companies': top_companies,
+        'exp_dist': exp_dist,
+        'exp_salary': exp_salary
+    }
+
+# Unfiltered aggregates are computed once and shared across reruns and sessions
 @st.cache_data
-def load_data():
-    df = pd.read_csv('data/processed/india_jobs_cleaned.csv')
-    return df
+def precompute_global(data_mtime):
+    return compute_aggregates(load_data(data_mtime)[0])
+
+# Shared Plotly styling, built once instead of per figure
+BASE_LAYOUT = dict(showlegend=False)
+HBAR_KW = dict(orientation='h')
+
+# Pre-rendered chart images for the default landing view, shared across sessions.
+# Keyed on filter_key so a regenerated data file renders fresh images. Failures
+# (kaleido or the Chrome it drives unavailable) raise and are not cached.
+@st.cache_resource
+def render_png(chart_key, filter_key, _fig):
+    return _fig.to_image(format='png')
+
+# Chart builders, cached per data file and filter combination. Streamlit skips hashing
+# the underscored data argument; filter_key already determines its contents.
+@st.cache_data(max_entries=32)
+def build_salary_hist(filter_key, _sal, median_salary):
+    fig = px.histogram(
+        {'avg_salary_lpa': _sal},
+        x='avg_salary_lpa',
+        nbins=30,
+        title='Salary Distribution',
+        labels={'avg_salary_lpa': 'Salary (₹ LPA)'},
+        color_discrete_sequence=['#FF6B35']
+    )
+    fig.add_vline(x=median_salary, line_dash="dash", line_color="red",
+                  annotation_text=f"Median: ₹{median_salary:.1f}L")
+    fig.update_layout(
+        xaxis_title="Annual Salary (₹ LPA)",
+        yaxis_title="Number of Jobs",
+        **BASE_LAYOUT
+    )
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_seniority_salary_bar(filter_key, _data):
+    fig = px.bar(
+        _data,
+        x='avg_salary_lpa',
+        y='seniority',
+        **HBAR_KW,
+        title='Median Salary by Seniority Level',
+        labels={'avg_salary_lpa': 'Median Salary (₹ LPA)', 'seniority': 'Seniority Level'},
+        color='avg_salary_lpa',
+        color_continuous_scale='Oranges',
+        text='avg_salary_lpa'
+    )
+    fig.update_traces(texttemplate='₹%{text:.1f}L', textposition='outside')
+    fig.update_layout(**BASE_LAYOUT)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_category_salary_bar(filter_key, _data):
+    fig = px.bar(
+        _data,
+        x='avg_salary_lpa',
+        y='job_category',
+        **HBAR_KW,
+        title='Median Salary by Job Category (min 5 jobs)',
+        labels={'avg_salary_lpa': 'Median Salary (₹ LPA)', 'job_category': 'Job Category'},
+        color='avg_salary_lpa',
+        color_continuous_scale='RdYlGn',
+        text='avg_salary_lpa'
+    )
+    fig.update_traces(texttemplate='₹%{text:.1f}L', textposition='outside')
+    fig.update_layout(**BASE_LAYOUT, height=500)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_skills_bar(filter_key, _data):
+    fig = px.bar(
+        _data,
+        x='Count',
+        y='Skill',
+        **HBAR_KW,
+        title='Top 12 Most In-Demand Skills',
+        labels={'Count': 'Number of Jobs'},
+        color='Count',
+        color_continuous_scale='Blues',
+        text='Count'
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(**BASE_LAYOUT, height=500)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_category_pie(filter_key, _data):
+    fig = px.pie(
+        _data,
+        values='Count',
+        names='Category',
+        title='Top 8 Job Categories',
+        hole=0.4,
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_seniority_dist_bar(filter_key, _data):
+    fig = px.bar(
+        _data,
+        x='Count',
+        y='Level',
+        **HBAR_KW,
+        title='Distribution by Seniority Level',
+        color='Count',
+        color_continuous_scale='Greens',
+        text='Count'
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(**BASE_LAYOUT)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_companies_bar(filter_key, _data):
+    fig = px.bar(
+        _data,
+        x='Jobs',
+        y='Company',
+        **HBAR_KW,
+        title='Top 15 Companies Hiring Data Professionals',
+        color='Jobs',
+        color_continuous_scale='Purples',
+        text='Jobs'
+    )
+    fig.update_traces(textposition='outside')
+    fig.update_layout(**BASE_LAYOUT, height=600)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_exp_dist_bar(filter_key, _data):
+    fig = px.bar(
+        _data,
+        x='Experience (years)',
+        y='Jobs',
+        title='Job Distribution by Experience Required',
+        color='Jobs',
+        color_continuous_scale='Teal'
+    )
+    fig.update_layout(**BASE_LAYOUT)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_exp_salary_line(filter_key, _data):
+    fig = px.line(
+        _data,
+        x='min_experience_clean',
+        y='avg_salary_lpa',
+        title='Median Salary by Years of Experience',
+        labels={'min_experience_clean': 'Years of Experience', 'avg_salary_lpa': 'Median Salary (₹ LPA)'},
+        markers=True
+    )
+    fig.update_traces(line_color='#E74C3C', marker=dict(size=10))
+    return fig
 
-df = load_data()
+data_mtime = os.path.getmtime(DATA_PATH)
+df, SKILL_COLS, _ = load_data(data_mtime)
 
 # Title
 st.title(" India Data Science Job Market Analysis 2025")
@@ -35,6 +305,7 @@ st.sidebar.header("🔍 Filters")
 
 # Job Category filter
 all_categories = sorted(df['job_category'].unique().tolist())
+cat_to_code = {c: i for i, c in enumerate(df['job_category'].cat.categories)}
 selected_categories = st.sidebar.multiselect(
     "Job Categories",
     all_categories,
@@ -60,18 +331,60 @@ exp_range = st.sidebar.slider(
     0, max_exp, (0, max_exp)
 )
 
-# Apply filters
-filtered_df = df[
-    (df['job_category'].isin(selected_categories)) &
-    (df['avg_salary_lpa'].between(salary_range[0], salary_range[1])) &
-    (df['min_experience_clean'].between(exp_range[0], exp_range[1]))
-]
+# Apply filters as a single boolean mask over the raw column arrays
+cat = df['job_category'].cat.codes.to_numpy()
+sal = df['avg_salary_lpa'].to_numpy()
+exp = df['min_experience_clean'].to_numpy()
+sel_codes = np.fromiter((cat_to_code[c] for c in selected_categories), dtype=np.int16)
+mask_kernel = get_mask_kernel()
+if mask_kernel is not None:
+    mask = np.empty(len(df), dtype=np.bool_)
+    mask_kernel(cat, sal, exp, sel_codes, salary_range[0], salary_range[1],
+                exp_range[0], exp_range[1], mask)
+else:
+    mask = (
+        np.isin(cat, sel_codes) &
+        (sal >= salary_range[0]) & (sal <= salary_range[1]) &
+        (exp >= exp_range[0]) & (exp <= exp_range[1])
+    )
 
 if selected_seniority != 'All':
-    filtered_df = filtered_df[filtered_df['seniority'] == selected_seniority]
+    sen_code = df['seniority'].cat.categories.get_loc(selected_seniority)
+    mask &= df['seniority'].cat.codes.to_numpy() == sen_code
+
+filtered_df = df.iloc[mask]
+# Filtered salaries as one array, reused by the salary metrics and histogram
+sal_arr = sal[mask]
 
 st.sidebar.metric("Jobs Matching Filters", len(filtered_df))
 
+# Identifies the filtered data for the figure caches; data_mtime covers regenerated files
+filter_key = (data_mtime, tuple(selected_categories), selected_seniority, salary_range, exp_range)
+
+# Landing view every visitor sees before touching a filter
+is_default_view = (
+    selected_categories == all_categories[:3] and
+    selected_seniority == 'All' and
+    salary_range == (min_sal, max_sal) and
+    exp_range == (0, max_exp)
+)
+
+def show_chart(fig, chart_key):
+    # Static PNG on the landing view, interactive Plotly once filters change
+    if is_default_view:
+        try:
+            st.image(render_png(chart_key, filter_key, fig), use_container_width=True)
+            return
+        except (ValueError, RuntimeError):
+            pass
+    st.plotly_chart(fig, use_container_width=True)
+
+# Reuse the cached full-dataset aggregates when the filters keep every row
+if len(filtered_df) == len(df):
+    aggs = precompute_global(data_mtime)
+else:
+    aggs = compute_aggregates(filtered_df)
+
 # Main metrics
 col1, col2, col3, col4 = st.columns(4)
 
@@ -79,7 +392,7 @@ with col1:
     st.metric("Total Jobs", len(filtered_df))
 
 with col2:
-    median_salary = filtered_df['avg_salary_lpa'].median()
+    median_salary = np.nanmedian(sal_arr) if np.any(~np.isnan(sal_arr)) else np.nan
     st.metric("Median Salary", f"₹{median_salary:.1f} LPA")
 
 with col3:
@@ -99,104 +412,45 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Salary distribution
-    fig_salary = px.histogram(
-        filtered_df,
-        x='avg_salary_lpa',
-        nbins=30,
-        title='Salary Distribution',
-        labels={'avg_salary_lpa': 'Salary (₹ LPA)'},
-        color_discrete_sequence=['#FF6B35']
-    )
-    fig_salary.add_vline(x=median_salary, line_dash="dash", line_color="red",
-                         annotation_text=f"Median: ₹{median_salary:.1f}L")
-    fig_salary.update_layout(
-        xaxis_title="Annual Salary (₹ LPA)",
-        yaxis_title="Number of Jobs",
-        showlegend=False
-    )
-    st.plotly_chart(fig_salary, use_container_width=True)
+    fig_salary = build_salary_hist(filter_key, sal_arr, median_salary)
+    show_chart(fig_salary, 'salary')
 
 with col2:
     # Salary by seniority
-    salary_by_seniority = filtered_df.groupby('seniority')['avg_salary_lpa'].median().reset_index()
-    salary_by_seniority = salary_by_seniority.sort_values('avg_salary_lpa')
+    salary_by_seniority = aggs['salary_by_seniority']
     
-    fig_seniority = px.bar(
-        salary_by_seniority,
-        x='avg_salary_lpa',
-        y='seniority',
-        orientation='h',
-        title='Median Salary by Seniority Level',
-        labels={'avg_salary_lpa': 'Median Salary (₹ LPA)', 'seniority': 'Seniority Level'},
-        color='avg_salary_lpa',
-        color_continuous_scale='Oranges',
-        text='avg_salary_lpa'
-    )
-    fig_seniority.update_traces(texttemplate='₹%{text:.1f}L', textposition='outside')
-    fig_seniority.update_layout(showlegend=False)
-    st.plotly_chart(fig_seniority, use_container_width=True)
+    fig_seniority = build_seniority_salary_bar(filter_key, salary_by_seniority)
+    show_chart(fig_seniority, 'seniority')
 
 # Salary by job category
-cat_salary = filtered_df.groupby('job_category').agg({
-    'avg_salary_lpa': 'median',
-    'job_title': 'count'
-}).rename(columns={'job_title': 'count'}).reset_index()
-cat_salary = cat_salary[cat_salary['count'] >= 5].sort_values('avg_salary_lpa', ascending=False).head(10)
-
-fig_cat_sal = px.bar(
-    cat_salary,
-    x='avg_salary_lpa',
-    y='job_category',
-    orientation='h',
-    title='Median Salary by Job Category (min 5 jobs)',
-    labels={'avg_salary_lpa': 'Median Salary (₹ LPA)', 'job_category': 'Job Category'},
-    color='avg_salary_lpa',
-    color_continuous_scale='RdYlGn',
-    text='avg_salary_lpa'
-)
-fig_cat_sal.update_traces(texttemplate='₹%{text:.1f}L', textposition='outside')
-fig_cat_sal.update_layout(showlegend=False, height=500)
-st.plotly_chart(fig_cat_sal, use_container_width=True)
+cat_salary = aggs['cat_salary']
+
+fig_cat_sal = build_category_salary_bar(filter_key, cat_salary)
+show_chart(fig_cat_sal, 'cat_sal')
 
 st.divider()
 
 # Row 2: Skills Analysis
 st.header("🛠️ Skills Analysis")
 
-skill_cols = [col for col in filtered_df.columns if col.startswith('skill_')]
-skill_counts = {}
-for col in skill_cols:
-    skill_name = col.replace('skill_', '').replace('_', ' ').title()
-    count = filtered_df[col].sum()
-    if count > 0:
-        skill_counts[skill_name] = count
-
-top_skills = dict(sorted(skill_counts.items(), key=lambda x: x[1], reverse=True)[:12])
-
-if len(top_skills) > 0:
-    skills_df = pd.DataFrame({
-        'Skill': list(top_skills.keys()),
-        'Count': list(top_skills.values())
-    })
+skill_names = aggs['skill_names']
+skill_totals = aggs['skill_totals']
+# Stable sort keeps column order among equal counts, including at the 12th place.
+# Totals are unsigned, so cast before negating.
+top_idx = np.argsort(-skill_totals.astype(np.int64), kind='stable')[:12]
+skills_df = pd.DataFrame({
+    'Skill': [skill_names[i] for i in top_idx],
+    'Count': skill_totals[top_idx]
+})
+
+if len(skills_df) > 0:
     skills_df['Percentage'] = (skills_df['Count'] / len(filtered_df) * 100).round(1)
     
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        fig_skills = px.bar(
-            skills_df,
-            x='Count',
-            y='Skill',
-            orientation='h',
-            title='Top 12 Most In-Demand Skills',
-            labels={'Count': 'Number of Jobs'},
-            color='Count',
-            color_continuous_scale='Blues',
-            text='Count'
-        )
-        fig_skills.update_traces(textposition='outside')
-        fig_skills.update_layout(showlegend=False, height=500)
-        st.plotly_chart(fig_skills, use_container_width=True)
+        fig_skills = build_skills_bar(filter_key, skills_df)
+        show_chart(fig_skills, 'skills')
     
     with col2:
         st.subheader("Skills Demand")
@@ -217,60 +471,27 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Job category distribution
-    job_cats = filtered_df['job_category'].value_counts().head(8).reset_index()
-    job_cats.columns = ['Category', 'Count']
+    job_cats = aggs['job_cats']
     
-    fig_cats = px.pie(
-        job_cats,
-        values='Count',
-        names='Category',
-        title='Top 8 Job Categories',
-        hole=0.4,
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
-    fig_cats.update_traces(textposition='inside', textinfo='percent+label')
-    st.plotly_chart(fig_cats, use_container_width=True)
+    fig_cats = build_category_pie(filter_key, job_cats)
+    show_chart(fig_cats, 'cats')
 
 with col2:
     # Seniority distribution
-    seniority_dist = filtered_df['seniority'].value_counts().reset_index()
-    seniority_dist.columns = ['Level', 'Count']
+    seniority_dist = aggs['seniority_dist']
     
-    fig_sen = px.bar(
-        seniority_dist,
-        x='Count',
-        y='Level',
-        orientation='h',
-        title='Distribution by Seniority Level',
-        color='Count',
-        color_continuous_scale='Greens',
-        text='Count'
-    )
-    fig_sen.update_traces(textposition='outside')
-    fig_sen.update_layout(showlegend=False)
-    st.plotly_chart(fig_sen, use_container_width=True)
+    fig_sen = build_seniority_dist_bar(filter_key, seniority_dist)
+    show_chart(fig_sen, 'sen')
 
 st.divider()
 
 # Row 4: Top Companies
 st.header("🏢 Top Hiring Companies")
 
-top_companies = filtered_df['company'].value_counts().head(15).reset_index()
-top_companies.columns = ['Company', 'Jobs']
-
-fig_companies = px.bar(
-    top_companies,
-    x='Jobs',
-    y='Company',
-    orientation='h',
-    title='Top 15 Companies Hiring Data Professionals',
-    color='Jobs',
-    color_continuous_scale='Purples',
-    text='Jobs'
-)
-fig_companies.update_traces(textposition='outside')
-fig_companies.update_layout(showlegend=False, height=600)
-st.plotly_chart(fig_companies, use_container_width=True)
+top_companies = aggs['top_companies']
+
+fig_companies = build_companies_bar(filter_key, top_companies)
+show_chart(fig_companies, 'companies')
 
 st.divider()
 
@@ -281,67 +502,52 @@ col1, col2 = st.columns(2)
 
 with col1:
     # Experience distribution
-    exp_dist = filtered_df['min_experience_clean'].value_counts().sort_index().head(15).reset_index()
-    exp_dist.columns = ['Experience (years)', 'Jobs']
+    exp_dist = aggs['exp_dist']
     
-    fig_exp = px.bar(
-        exp_dist,
-        x='Experience (years)',
-        y='Jobs',
-        title='Job Distribution by Experience Required',
-        color='Jobs',
-        color_continuous_scale='Teal'
-    )
-    fig_exp.update_layout(showlegend=False)
-    st.plotly_chart(fig_exp, use_container_width=True)
+    fig_exp = build_exp_dist_bar(filter_key, exp_dist)
+    show_chart(fig_exp, 'exp')
 
 with col2:
     # Salary vs Experience
-    exp_salary = filtered_df.groupby('min_experience_clean')['avg_salary_lpa'].median().reset_index()
-    exp_salary = exp_salary[exp_salary['min_experience_clean'] <= 15]
+    exp_salary = aggs['exp_salary']
     
-    fig_exp_sal = px.line(
-        exp_salary,
-        x='min_experience_clean',
-        y='avg_salary_lpa',
-        title='Median Salary by Years of Experience',
-        labels={'min_experience_clean': 'Years of Experience', 'avg_salary_lpa': 'Median Salary (₹ LPA)'},
-        markers=True
-    )
-    fig_exp_sal.update_traces(line_color='#E74C3C', marker=dict(size=10))
-    st.plotly_chart(fig_exp_sal, use_container_width=True)
+    fig_exp_sal = build_exp_salary_line(filter_key, exp_salary)
+    show_chart(fig_exp_sal, 'exp_sal')
 
 st.divider()
 
 # Key Insights
+cat_counts = aggs['cat_counts']
+lvl_stats = aggs['lvl_stats']
+
 st.header("💡 Key Insights")
 
 col1, col2, col3 = st.columns(3)
 
 with col1:
     st.subheader("💰 Salary by Level")
-    for level in ['Junior', 'Mid-Level', 'Senior']:
-        level_data = filtered_df[filtered_df['seniority'] == level]['avg_salary_lpa']
-        if len(level_data) > 0:
-            st.metric(level, f"₹{level_data.median():.1f}L", f"{len(level_data)} jobs")
+    for level in ('Junior', 'Mid-Level', 'Senior'):
+        if level in lvl_stats.index:
+            r = lvl_stats.loc[level]
+            st.metric(level, f"₹{r['median']:.1f}L", f"{int(r['size'])} jobs")
 
 with col2:
     st.subheader("🛠️ Must-Have Skills")
-    top_3 = list(top_skills.keys())[:3] if len(top_skills) >= 3 else list(top_skills.keys())
-    for i, skill in enumerate(top_3, 1):
-        pct = (top_skills[skill] / len(filtered_df)) * 100
+    top_3 = skills_df.head(3)
+    for i, (skill, count) in enumerate(zip(top_3['Skill'], top_3['Count']), 1):
+        pct = (count / len(filtered_df)) * 100
         st.write(f"**{i}. {skill}** - {pct:.0f}% of jobs")
 
 with col3:
     st.subheader("📊 Market Snapshot")
-    top_cat = filtered_df['job_category'].mode()[0] if len(filtered_df) > 0 else "N/A"
-    top_cat_count = len(filtered_df[filtered_df['job_category'] == top_cat])
+    top_cat = cat_counts.index[0] if len(cat_counts) > 0 else "N/A"
+    top_cat_count = int(cat_counts.iloc[0]) if len(cat_counts) > 0 else 0
     
     st.metric("Top Category", top_cat)
     st.write(f"**{top_cat_count} openings**")
     
-    if len(filtered_df[filtered_df['avg_salary_lpa'].notna()]) > 0:
-        salary_range = f"₹{filtered_df['avg_salary_lpa'].min():.1f}L - ₹{filtered_df['avg_salary_lpa'].max():.1f}L"
+    if np.any(~np.isnan(sal_arr)):
+        salary_range = f"₹{np.nanmin(sal_arr):.1f}L - ₹{np.nanmax(sal_arr):.1f}L"
         st.write(f"**Salary Range:** {salary_range}")
 
 # Additional context
@@ -352,8 +558,8 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.write("**Salary Growth Potential:**")
-    junior_sal = filtered_df[filtered_df['seniority'] == 'Junior']['avg_salary_lpa'].median()
-    senior_sal = filtered_df[filtered_df['seniority'] == 'Senior']['avg_salary_lpa'].median()
+    junior_sal = lvl_stats['median'].get('Junior', np.nan)
+    senior_sal = lvl_stats['median'].get('Senior', np.nan)
     
     if pd.notna(junior_sal) and pd.notna(senior_sal) and junior_sal > 0:
         growth_pct = ((senior_sal - junior_sal) / junior_sal) * 100
@@ -363,10 +569,9 @@ with col1:
 
 with col2:
     st.write("**Job Market Composition:**")
-    for cat in filtered_df['job_category'].value_counts().head(3).index:
-        count = len(filtered_df[filtered_df['job_category'] == cat])
-        pct = (count / len(filtered_df)) * 100
-        st.write(f"- {cat}: {pct:.1f}% of market")
+    market_share = cat_counts.head(3) / len(filtered_df) * 100
+    for category, pct in market_share.items():
+        st.write(f"- {category}: {pct:.1f}% of market")
 
 # Footer
 st.divider()
@@ -0,0 +1,10 @@
+import pandas as pd
+
+# One-off conversion of the cleaned CSV to Parquet for faster dashboard loads.
+# Re-run whenever data/processed/india_jobs_cleaned.csv is regenerated.
+CSV_PATH = 'data/processed/india_jobs_cleaned.csv'
+PARQUET_PATH = 'data/processed/india_jobs_cleaned.parquet'
+
+df = pd.read_csv(CSV_PATH)
+df.to_parquet(PARQUET_PATH, engine='pyarrow', compression='zstd', index=False)
+print(f"✓ Wrote {len(df)} rows to {PARQUET_PATH}")